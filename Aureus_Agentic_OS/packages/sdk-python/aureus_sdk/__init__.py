@@ -4,7 +4,9 @@ Aureus Python SDK
 Python client bindings for Aureus Agentic OS.
 """
 
-from aureus_sdk.client import AureusClient
+from pydantic import BaseModel
+
+from aureus_sdk.client import AureusClient, AureusSyncClient
 from aureus_sdk.models.common import DataZone, Intent, Permission, RiskTier
 from aureus_sdk.models.crv import (
     Commit,
@@ -56,6 +58,7 @@ __version__ = "0.1.0"
 __all__ = [
     # Client
     "AureusClient",
+    "AureusSyncClient",
     # Common types
     "RiskTier",
     "Intent",
@@ -101,3 +104,18 @@ __all__ = [
     "WorkflowExecutionResult",
     "TaskExecutionResult",
 ]
+
+
+def _build_models() -> None:
+    """Build any exported model whose schema is still incomplete.
+    
+    Schemas are normally built at class definition; this catches models deferred
+    by forward references so the first request does not pay the build cost.
+    """
+    for name in __all__:
+        obj = globals()[name]
+        if isinstance(obj, type) and issubclass(obj, BaseModel):
+            obj.model_rebuild()
+
+
+_build_models()
@@ -2,10 +2,16 @@
 Aureus SDK client for interacting with Aureus Agentic OS.
 """
 
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import logging
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Set, Tuple, cast
 
 import httpx
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter
 
 from aureus_sdk.models.crv import Commit, GateConfig, GateResult, ValidationResult
 from aureus_sdk.models.execution import WorkflowExecutionRequest, WorkflowExecutionResult
@@ -13,8 +19,241 @@ from aureus_sdk.models.observability import Metric, Span, TelemetryEvent
 from aureus_sdk.models.policy import Action, GuardDecision, PolicyContext, Principal
 from aureus_sdk.models.workflow import WorkflowSpec
 
+# Module-level adapters so list responses are validated in a single pydantic-core pass
+_METRIC_LIST = TypeAdapter(List[Metric])
+_SPAN_LIST = TypeAdapter(List[Span])
 
-class AureusClient:
+logger = logging.getLogger(__name__)
+
+# Connection pool sized for many concurrent agent tasks sharing one client
+DEFAULT_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+
+WIRE_FORMATS = ("json", "msgpack")
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_SharedKey = Tuple[str, Optional[str]]
+
+
+class _TelemetryBatcher:
+    """
+    Buffers telemetry payloads and POSTs them to a batch endpoint as one array.
+    
+    A batch is sent when it reaches ``max_items`` or ``flush_interval`` seconds
+    after its first item was buffered, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, Any], Awaitable[None]],
+        path: str,
+        flush_interval: float,
+        max_items: int,
+    ):
+        self._send = send
+        self._path = path
+        self._flush_interval = flush_interval
+        self._max_items = max_items
+        self._buffer: List[Any] = []
+        # Timer still waiting for the flush interval; once it fires it moves to
+        # _in_flight until its send completes, so flush() can wait for it
+        self._timer: Optional["asyncio.Task[None]"] = None
+        self._in_flight: Set["asyncio.Task[None]"] = set()
+
+    async def put(self, payload: Any) -> None:
+        """Buffer a payload, sending the batch if it is full."""
+        self._buffer.append(payload)
+        if len(self._buffer) >= self._max_items:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.ensure_future(self._flush_later())
+
+    async def flush(self) -> None:
+        """Send all buffered payloads now and wait for timer-triggered sends in flight."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._buffer = self._buffer, []
+        if batch:
+            await self._send(self._path, batch)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        task = self._timer
+        self._timer = None
+        if task is not None:
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+        batch, self._buffer = self._buffer, []
+        try:
+            if batch:
+                await self._send(self._path, batch)
+        except httpx.HTTPError as exc:
+            logger.warning("Dropped telemetry batch for %s: %s", self._path, exc)
+
+
+class _BaseClient:
+    """Configuration and request builders shared by the async and sync clients."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str],
+        timeout: float,
+        wire_format: str,
+        deny_cache_size: int,
+    ):
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"wire_format must be one of {WIRE_FORMATS}, got {wire_format!r}")
+        
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.wire_format = wire_format
+        self.headers = {"Content-Type": "application/json"}
+        
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+        
+        self._msgpack: Any = None
+        if wire_format == "msgpack":
+            try:
+                import msgpack
+            except ImportError as exc:
+                raise ImportError(
+                    'wire_format="msgpack" requires msgpack: pip install "aureus-sdk[msgpack]"'
+                ) from exc
+            self._msgpack = msgpack
+        
+        # LRU of (principal_id, action_id) pairs the server denied; disabled when size is 0
+        self._deny_cache_size = deny_cache_size
+        self._denied: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+
+    def clear_permission_cache(self, principal_id: Optional[str] = None) -> None:
+        """
+        Forget cached permission denials.
+        
+        Call this when permissions are granted or policies change.
+        
+        Args:
+            principal_id: Only forget denials for this principal (default: all)
+        """
+        if principal_id is None:
+            self._denied.clear()
+            return
+        for key in [key for key in self._denied if key[0] == principal_id]:
+            del self._denied[key]
+
+    def _is_cached_denial(self, principal: Principal, action: Action) -> bool:
+        """Whether the server already denied this principal/action pair."""
+        key = (principal.id, action.id)
+        if key not in self._denied:
+            return False
+        self._denied.move_to_end(key)
+        return True
+
+    def _record_permission(self, principal: Principal, action: Action, allowed: bool) -> None:
+        """Remember a denial from the server (no-op when the cache is disabled)."""
+        if allowed or not self._deny_cache_size:
+            return
+        self._denied[(principal.id, action.id)] = None
+        if len(self._denied) > self._deny_cache_size:
+            self._denied.popitem(last=False)
+
+    def _http_client_kwargs(
+        self,
+        http2: bool,
+        limits: Optional[httpx.Limits],
+        transport: Any,
+    ) -> Dict[str, Any]:
+        """Keyword arguments for the default httpx client."""
+        return {
+            "base_url": self.base_url,
+            "headers": self.headers,
+            "timeout": self.timeout,
+            "http2": http2,
+            "limits": limits or DEFAULT_LIMITS,
+            "transport": transport,
+        }
+
+    def _telemetry_payload(self, item: BaseModel) -> Any:
+        """Encode one telemetry model: JSON bytes, or a JSON-compatible dict for msgpack."""
+        # The model's own serializer skips the model_dump_json/TypeAdapter wrappers
+        if self._msgpack is None:
+            return item.__pydantic_serializer__.to_json(item)
+        return item.__pydantic_serializer__.to_python(item, mode="json")
+
+    def _telemetry_body(self, payload: Any) -> Dict[str, Any]:
+        """httpx body arguments for one encoded telemetry payload or a list of them."""
+        if self._msgpack is not None:
+            return {
+                "content": self._msgpack.packb(payload),
+                "headers": {"Content-Type": MSGPACK_CONTENT_TYPE},
+            }
+        if isinstance(payload, list):
+            payload = b"[" + b",".join(payload) + b"]"
+        return {"content": payload, "headers": _JSON_HEADERS}
+
+    @staticmethod
+    def _workflow_body(
+        workflow: WorkflowSpec,
+        context: Optional[Dict[str, Any]],
+        correlation_id: Optional[str],
+    ) -> Dict[str, Any]:
+        request = WorkflowExecutionRequest(
+            workflow=workflow,
+            context=context,
+            correlation_id=correlation_id,
+        )
+        return {
+            "content": request.__pydantic_serializer__.to_json(request),
+            "headers": _JSON_HEADERS,
+        }
+
+    @staticmethod
+    def _json_body(payload: Any) -> Dict[str, Any]:
+        """httpx body arguments for a payload encoded by pydantic-core (models included)."""
+        # Field names, not aliases, to match model_dump_json() and the other request bodies
+        return {
+            "content": pydantic_core.to_json(payload, by_alias=False),
+            "headers": _JSON_HEADERS,
+        }
+
+    @staticmethod
+    def _json_dict(response: httpx.Response) -> Dict[str, Any]:
+        """Decode a JSON object response body."""
+        return cast(Dict[str, Any], response.json())
+
+    @classmethod
+    def _allowed(cls, response: httpx.Response) -> bool:
+        """The "allowed" flag of a permission check response (False when absent)."""
+        return cast(bool, cls._json_dict(response).get("allowed", False))
+
+    @classmethod
+    def _approval_token(cls, response: httpx.Response) -> str:
+        """The approval token of an approval response (empty when absent)."""
+        return cast(str, cls._json_dict(response).get("approval_token", ""))
+
+    @staticmethod
+    def _metrics_params(
+        metric_name: Optional[str],
+        start_time: Optional[str],
+        end_time: Optional[str],
+        tags: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if metric_name:
+            params["name"] = metric_name
+        if start_time:
+            params["start_time"] = start_time
+        if end_time:
+            params["end_time"] = end_time
+        if tags:
+            params["tags"] = json.dumps(tags)
+        return params
+
+
+class AureusClient(_BaseClient):
     """
     Client for interacting with Aureus Agentic OS.
     
@@ -22,11 +261,26 @@ class AureusClient:
     and observability reporting.
     """
 
+    # Shared clients per event loop: an httpx.AsyncClient's connections are bound to the
+    # loop they were opened on, so each loop (e.g. each asyncio.run) gets its own pool
+    _shared_instances: ClassVar[
+        "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_SharedKey, AureusClient]]"
+    ] = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         base_url: str = "http://localhost:3000",
         api_key: Optional[str] = None,
         timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        batch_telemetry: bool = False,
+        batch_flush_interval: float = 0.05,
+        batch_max_items: int = 128,
+        wire_format: str = "json",
+        deny_cache_size: int = 0,
     ):
         """
         Initialize the Aureus client.
@@ -35,22 +289,102 @@ class AureusClient:
             base_url: Base URL of the Aureus API
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds
+            client: Optional pre-configured httpx.AsyncClient to reuse. It is used
+                as-is (base URL and headers must already be set) and is not closed
+                by close().
+            http2: Enable HTTP/2 on the default client (requires ``aureus-sdk[http2]``)
+            limits: Connection pool limits for the default client
+            transport: Optional httpx transport for the default client, e.g.
+                httpx.MockTransport in tests (http2 and limits are then unused)
+            batch_telemetry: Buffer report_event/report_metric/report_span calls
+                and send them to the batch endpoints instead of one POST each
+            batch_flush_interval: Maximum seconds a telemetry item stays buffered
+            batch_max_items: Maximum telemetry items per batch request
+            wire_format: Body encoding for telemetry requests, "json" or "msgpack"
+                (msgpack requires ``aureus-sdk[msgpack]``)
+            deny_cache_size: Remember up to this many denied (principal, action)
+                pairs so repeated check_permission calls for them skip the request.
+                Disabled by default; see clear_permission_cache().
         """
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self.headers = {"Content-Type": "application/json"}
+        super().__init__(base_url, api_key, timeout, wire_format, deny_cache_size)
         
-        if api_key:
-            self.headers["Authorization"] = f"Bearer {api_key}"
-        
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers,
-            timeout=timeout,
+        self._owns_client = client is None
+        self._shared = False
+        self._client = client or httpx.AsyncClient(
+            **self._http_client_kwargs(http2, limits, transport)
         )
+        
+        self._batchers: Optional[Dict[str, _TelemetryBatcher]] = None
+        if batch_telemetry:
+            self._batchers = {
+                kind: _TelemetryBatcher(
+                    self._post_telemetry,
+                    f"/api/v1/observability/{kind}:batch",
+                    batch_flush_interval,
+                    batch_max_items,
+                )
+                for kind in ("events", "metrics", "spans")
+            }
+
+    @classmethod
+    def shared(
+        cls,
+        base_url: str = "http://localhost:3000",
+        api_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "AureusClient":
+        """
+        Get the running event loop's shared client for the given base URL and API key.
+        
+        Reusing one client keeps its connection pool warm across tasks instead of
+        paying a new TCP/TLS handshake per client. Instances are cached per event
+        loop, since connections cannot be reused across loops; a later asyncio.run()
+        gets a fresh client. close() is a no-op on shared instances; use
+        close_shared() before the loop shuts down.
+        
+        Args:
+            base_url: Base URL of the Aureus API
+            api_key: Optional API key for authentication
+            **kwargs: Extra constructor arguments, used only when the shared
+                instance is first created
+            
+        Returns:
+            Shared AureusClient instance
+            
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        instances = cls._shared_instances.setdefault(asyncio.get_running_loop(), {})
+        key = (base_url.rstrip("/"), api_key)
+        instance = instances.get(key)
+        if instance is None:
+            instance = cls(base_url=base_url, api_key=api_key, **kwargs)
+            instance._shared = True
+            instances[key] = instance
+        return instance
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        """Close and forget the running event loop's shared clients."""
+        instances = list(cls._shared_instances.pop(asyncio.get_running_loop(), {}).values())
+        for instance in instances:
+            await instance.flush()
+            await instance._client.aclose()
+
+    async def flush(self) -> None:
+        """Send any buffered telemetry (no-op unless batch_telemetry is enabled)."""
+        if self._batchers:
+            for batcher in self._batchers.values():
+                await batcher.flush()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Flush buffered telemetry and close the HTTP client.
+        
+        The HTTP client is left open for shared or injected clients.
+        """
+        await self.flush()
+        if self._shared or not self._owns_client:
+            return
         await self._client.aclose()
 
     async def __aenter__(self) -> "AureusClient":
@@ -80,15 +414,9 @@ class AureusClient:
         Returns:
             WorkflowExecutionResult with execution details
         """
-        request = WorkflowExecutionRequest(
-            workflow=workflow,
-            context=context,
-            correlation_id=correlation_id,
-        )
-        
         response = await self._client.post(
             "/api/v1/workflows/execute",
-            json=json.loads(request.model_dump_json()),
+            **self._workflow_body(workflow, context, correlation_id),
         )
         response.raise_for_status()
         
@@ -106,7 +434,7 @@ class AureusClient:
         """
         response = await self._client.get(f"/api/v1/workflows/{workflow_id}/status")
         response.raise_for_status()
-        return response.json()
+        return self._json_dict(response)
 
     async def cancel_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """
@@ -120,7 +448,7 @@ class AureusClient:
         """
         response = await self._client.post(f"/api/v1/workflows/{workflow_id}/cancel")
         response.raise_for_status()
-        return response.json()
+        return self._json_dict(response)
 
     # CRV Methods
 
@@ -139,12 +467,10 @@ class AureusClient:
         Returns:
             GateResult with validation details
         """
-        payload = {
-            "commit": json.loads(commit.model_dump_json()),
-            "gate_config": json.loads(gate_config.model_dump_json()),
-        }
-        
-        response = await self._client.post("/api/v1/crv/validate", json=payload)
+        response = await self._client.post(
+            "/api/v1/crv/validate",
+            **self._json_body({"commit": commit, "gate_config": gate_config}),
+        )
         response.raise_for_status()
         
         return GateResult.model_validate(response.json())
@@ -165,9 +491,9 @@ class AureusClient:
             Registration result
         """
         payload = {"validator_id": validator_id, "config": validator_config}
-        response = await self._client.post("/api/v1/crv/validators", json=payload)
+        response = await self._client.post("/api/v1/crv/validators", **self._json_body(payload))
         response.raise_for_status()
-        return response.json()
+        return self._json_dict(response)
 
     # Policy Methods
 
@@ -186,7 +512,7 @@ class AureusClient:
         """
         response = await self._client.post(
             "/api/v1/policy/evaluate",
-            json=json.loads(context.model_dump_json()),
+            **self._json_body(context),
         )
         response.raise_for_status()
         
@@ -207,16 +533,18 @@ class AureusClient:
         Returns:
             True if permitted, False otherwise
         """
-        payload = {
-            "principal": json.loads(principal.model_dump_json()),
-            "action": json.loads(action.model_dump_json()),
-        }
+        if self._is_cached_denial(principal, action):
+            return False
         
-        response = await self._client.post("/api/v1/policy/check", json=payload)
+        response = await self._client.post(
+            "/api/v1/policy/check",
+            **self._json_body({"principal": principal, "action": action}),
+        )
         response.raise_for_status()
         
-        result = response.json()
-        return result.get("allowed", False)
+        allowed = self._allowed(response)
+        self._record_permission(principal, action, allowed)
+        return allowed
 
     async def request_approval(
         self,
@@ -235,17 +563,13 @@ class AureusClient:
         Returns:
             Approval token
         """
-        payload = {
-            "action": json.loads(action.model_dump_json()),
-            "principal": json.loads(principal.model_dump_json()),
-            "reason": reason,
-        }
-        
-        response = await self._client.post("/api/v1/policy/approval", json=payload)
+        response = await self._client.post(
+            "/api/v1/policy/approval",
+            **self._json_body({"action": action, "principal": principal, "reason": reason}),
+        )
         response.raise_for_status()
         
-        result = response.json()
-        return result.get("approval_token", "")
+        return self._approval_token(response)
 
     # Observability Methods
 
@@ -256,10 +580,7 @@ class AureusClient:
         Args:
             event: Telemetry event to report
         """
-        await self._client.post(
-            "/api/v1/observability/events",
-            json=json.loads(event.model_dump_json()),
-        )
+        await self._report("events", self._telemetry_payload(event))
 
     async def report_metric(self, metric: Metric) -> None:
         """
@@ -268,10 +589,7 @@ class AureusClient:
         Args:
             metric: Metric to report
         """
-        await self._client.post(
-            "/api/v1/observability/metrics",
-            json=json.loads(metric.model_dump_json()),
-        )
+        await self._report("metrics", self._telemetry_payload(metric))
 
     async def report_span(self, span: Span) -> None:
         """
@@ -280,10 +598,18 @@ class AureusClient:
         Args:
             span: Span to report
         """
-        await self._client.post(
-            "/api/v1/observability/spans",
-            json=json.loads(span.model_dump_json()),
-        )
+        await self._report("spans", self._telemetry_payload(span))
+
+    async def _report(self, kind: str, payload: Any) -> None:
+        """Send a telemetry payload directly or via its batcher."""
+        if self._batchers:
+            await self._batchers[kind].put(payload)
+        else:
+            await self._post_telemetry(f"/api/v1/observability/{kind}", payload)
+
+    async def _post_telemetry(self, path: str, payload: Any) -> None:
+        """POST a telemetry payload in the configured wire format."""
+        await self._client.post(path, **self._telemetry_body(payload))
 
     async def get_metrics(
         self,
@@ -304,20 +630,11 @@ class AureusClient:
         Returns:
             List of matching metrics
         """
-        params: Dict[str, Any] = {}
-        if metric_name:
-            params["name"] = metric_name
-        if start_time:
-            params["start_time"] = start_time
-        if end_time:
-            params["end_time"] = end_time
-        if tags:
-            params["tags"] = json.dumps(tags)
-        
+        params = self._metrics_params(metric_name, start_time, end_time, tags)
         response = await self._client.get("/api/v1/observability/metrics", params=params)
         response.raise_for_status()
         
-        return [Metric.model_validate(m) for m in response.json()]
+        return _METRIC_LIST.validate_json(response.content)
 
     async def get_trace(self, trace_id: str) -> List[Span]:
         """
@@ -332,4 +649,317 @@ class AureusClient:
         response = await self._client.get(f"/api/v1/observability/traces/{trace_id}")
         response.raise_for_status()
         
-        return [Span.model_validate(s) for s in response.json()]
+        return _SPAN_LIST.validate_json(response.content)
+
+
+class AureusSyncClient(_BaseClient):
+    """
+    Synchronous client for interacting with Aureus Agentic OS.
+    
+    Mirrors AureusClient for callers without an event loop, avoiding the cost of
+    asyncio.run() per request. Telemetry is always sent immediately (no batching).
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3000",
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        client: Optional[httpx.Client] = None,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        wire_format: str = "json",
+        deny_cache_size: int = 0,
+    ):
+        """
+        Initialize the synchronous Aureus client.
+        
+        Args:
+            base_url: Base URL of the Aureus API
+            api_key: Optional API key for authentication
+            timeout: Request timeout in seconds
+            client: Optional pre-configured httpx.Client to reuse. It is used
+                as-is (base URL and headers must already be set) and is not closed
+                by close().
+            http2: Enable HTTP/2 on the default client (requires ``aureus-sdk[http2]``)
+            limits: Connection pool limits for the default client
+            transport: Optional httpx transport for the default client, e.g.
+                httpx.MockTransport in tests (http2 and limits are then unused)
+            wire_format: Body encoding for telemetry requests, "json" or "msgpack"
+                (msgpack requires ``aureus-sdk[msgpack]``)
+            deny_cache_size: Remember up to this many denied (principal, action)
+                pairs so repeated check_permission calls for them skip the request.
+                Disabled by default; see clear_permission_cache().
+        """
+        super().__init__(base_url, api_key, timeout, wire_format, deny_cache_size)
+        
+        self._owns_client = client is None
+        self._client = client or httpx.Client(**self._http_client_kwargs(http2, limits, transport))
+
+    def close(self) -> None:
+        """Close the HTTP client (no-op for injected clients)."""
+        if self._owns_client:
+            self._client.close()
+
+    def __enter__(self) -> "AureusSyncClient":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    # Workflow Execution Methods
+
+    def execute_workflow(
+        self,
+        workflow: WorkflowSpec,
+        context: Optional[Dict[str, Any]] = None,
+        correlation_id: Optional[str] = None,
+    ) -> WorkflowExecutionResult:
+        """
+        Execute a workflow.
+        
+        Args:
+            workflow: Workflow specification to execute
+            context: Optional execution context
+            correlation_id: Optional correlation ID for tracing
+            
+        Returns:
+            WorkflowExecutionResult with execution details
+        """
+        response = self._client.post(
+            "/api/v1/workflows/execute",
+            **self._workflow_body(workflow, context, correlation_id),
+        )
+        response.raise_for_status()
+        
+        return WorkflowExecutionResult.model_validate(response.json())
+
+    def get_workflow_status(self, workflow_id: str) -> Dict[str, Any]:
+        """
+        Get the status of a workflow execution.
+        
+        Args:
+            workflow_id: Workflow identifier
+            
+        Returns:
+            Workflow status information
+        """
+        response = self._client.get(f"/api/v1/workflows/{workflow_id}/status")
+        response.raise_for_status()
+        return self._json_dict(response)
+
+    def cancel_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """
+        Cancel a running workflow.
+        
+        Args:
+            workflow_id: Workflow identifier
+            
+        Returns:
+            Cancellation result
+        """
+        response = self._client.post(f"/api/v1/workflows/{workflow_id}/cancel")
+        response.raise_for_status()
+        return self._json_dict(response)
+
+    # CRV Methods
+
+    def validate_commit(
+        self,
+        commit: Commit,
+        gate_config: GateConfig,
+    ) -> GateResult:
+        """
+        Validate a commit through a CRV gate.
+        
+        Args:
+            commit: Commit to validate
+            gate_config: Gate configuration
+            
+        Returns:
+            GateResult with validation details
+        """
+        response = self._client.post(
+            "/api/v1/crv/validate",
+            **self._json_body({"commit": commit, "gate_config": gate_config}),
+        )
+        response.raise_for_status()
+        
+        return GateResult.model_validate(response.json())
+
+    def register_validator(
+        self,
+        validator_id: str,
+        validator_config: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Register a custom CRV validator.
+        
+        Args:
+            validator_id: Unique validator identifier
+            validator_config: Validator configuration
+            
+        Returns:
+            Registration result
+        """
+        payload = {"validator_id": validator_id, "config": validator_config}
+        response = self._client.post("/api/v1/crv/validators", **self._json_body(payload))
+        response.raise_for_status()
+        return self._json_dict(response)
+
+    # Policy Methods
+
+    def evaluate_policy(
+        self,
+        context: PolicyContext,
+    ) -> GuardDecision:
+        """
+        Evaluate a policy decision.
+        
+        Args:
+            context: Policy evaluation context
+            
+        Returns:
+            GuardDecision with evaluation result
+        """
+        response = self._client.post(
+            "/api/v1/policy/evaluate",
+            **self._json_body(context),
+        )
+        response.raise_for_status()
+        
+        return GuardDecision.model_validate(response.json())
+
+    def check_permission(
+        self,
+        principal: Principal,
+        action: Action,
+    ) -> bool:
+        """
+        Check if a principal has permission for an action.
+        
+        Args:
+            principal: Principal to check
+            action: Action to evaluate
+            
+        Returns:
+            True if permitted, False otherwise
+        """
+        if self._is_cached_denial(principal, action):
+            return False
+        
+        response = self._client.post(
+            "/api/v1/policy/check",
+            **self._json_body({"principal": principal, "action": action}),
+        )
+        response.raise_for_status()
+        
+        allowed = self._allowed(response)
+        self._record_permission(principal, action, allowed)
+        return allowed
+
+    def request_approval(
+        self,
+        action: Action,
+        principal: Principal,
+        reason: str,
+    ) -> str:
+        """
+        Request approval for a high-risk action.
+        
+        Args:
+            action: Action requiring approval
+            principal: Principal requesting approval
+            reason: Reason for the request
+            
+        Returns:
+            Approval token
+        """
+        response = self._client.post(
+            "/api/v1/policy/approval",
+            **self._json_body({"action": action, "principal": principal, "reason": reason}),
+        )
+        response.raise_for_status()
+        
+        return self._approval_token(response)
+
+    # Observability Methods
+
+    def report_event(self, event: TelemetryEvent) -> None:
+        """
+        Report a telemetry event.
+        
+        Args:
+            event: Telemetry event to report
+        """
+        self._client.post(
+            "/api/v1/observability/events",
+            **self._telemetry_body(self._telemetry_payload(event)),
+        )
+
+    def report_metric(self, metric: Metric) -> None:
+        """
+        Report a metric.
+        
+        Args:
+            metric: Metric to report
+        """
+        self._client.post(
+            "/api/v1/observability/metrics",
+            **self._telemetry_body(self._telemetry_payload(metric)),
+        )
+
+    def report_span(self, span: Span) -> None:
+        """
+        Report a trace span.
+        
+        Args:
+            span: Span to report
+        """
+        self._client.post(
+            "/api/v1/observability/spans",
+            **self._telemetry_body(self._telemetry_payload(span)),
+        )
+
+    def get_metrics(
+        self,
+        metric_name: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None,
+    ) -> List[Metric]:
+        """
+        Query metrics.
+        
+        Args:
+            metric_name: Optional metric name filter
+            start_time: Optional start time filter
+            end_time: Optional end time filter
+            tags: Optional tag filters
+            
+        Returns:
+            List of matching metrics
+        """
+        params = self._metrics_params(metric_name, start_time, end_time, tags)
+        response = self._client.get("/api/v1/observability/metrics", params=params)
+        response.raise_for_status()
+        
+        return _METRIC_LIST.validate_json(response.content)
+
+    def get_trace(self, trace_id: str) -> List[Span]:
+        """
+        Get a complete trace by ID.
+        
+        Args:
+            trace_id: Trace identifier
+            
+        Returns:
+            List of spans in the trace
+        """
+        response = self._client.get(f"/api/v1/observability/traces/{trace_id}")
+        response.raise_for_status()
+        
+        return _SPAN_LIST.validate_json(response.content)
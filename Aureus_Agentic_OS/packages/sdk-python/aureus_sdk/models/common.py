@@ -2,10 +2,16 @@
 Common types shared across multiple modules.
 """
 
+import sys
 from enum import Enum
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+from typing_extensions import Annotated
+
+# For strings repeated across many instances (ids, metric names, tag keys): interning
+# keeps one object per distinct value and lets equality short-circuit on identity
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 class RiskTier(str, Enum):
@@ -44,3 +50,26 @@ class Permission(BaseModel):
     intent: Optional[Intent] = Field(None, description="Optional intent restriction")
     data_zone: Optional[DataZone] = Field(None, description="Optional data zone restriction")
     conditions: Optional[Dict[str, Any]] = Field(None, description="Additional conditions")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class IdentifiedModel(BaseModel):
+    """
+    Frozen value object identified by its ``id`` field.
+    
+    Instances hash by id, so they can key sets and dicts. Equality still compares
+    every field, but ignores private lookup caches built after validation.
+    """
+
+    id: str
+
+    model_config = ConfigDict(frozen=True)
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
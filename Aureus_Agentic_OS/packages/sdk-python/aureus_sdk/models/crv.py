@@ -5,7 +5,7 @@ CRV (Circuit Reasoning Validation) models matching the TypeScript CRV types.
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FailureTaxonomy(str, Enum):
@@ -32,6 +32,8 @@ class ValidationResult(BaseModel):
     )
     remediation: Optional[str] = Field(None, description="Remediation hint for the failure")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Commit(BaseModel):
     """Commit or state change to be validated."""
@@ -41,6 +43,8 @@ class Commit(BaseModel):
     previous_state: Optional[Any] = Field(None, description="Previous state")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class RetryAltToolStrategy(BaseModel):
     """Retry with alternative tool strategy."""
@@ -79,7 +83,9 @@ class RecoveryResult(BaseModel):
     """Recovery action result."""
 
     success: bool = Field(..., description="Whether recovery succeeded")
-    strategy: Dict[str, Any] = Field(..., description="Strategy that was applied")
+    strategy: RecoveryStrategy = Field(
+        ..., discriminator="type", description="Strategy that was applied"
+    )
     message: str = Field(..., description="Result message")
     recovered_data: Optional[Any] = Field(None, description="Recovered data")
 
@@ -93,8 +99,8 @@ class GateConfig(BaseModel):
     required_confidence: Optional[float] = Field(
         None, ge=0, le=1, description="Minimum confidence threshold"
     )
-    recovery_strategy: Optional[Dict[str, Any]] = Field(
-        None, description="Strategy to apply on failure"
+    recovery_strategy: Optional[RecoveryStrategy] = Field(
+        None, discriminator="type", description="Strategy to apply on failure"
     )
 
 
@@ -106,7 +112,11 @@ class GateResult(BaseModel):
     validation_results: List[ValidationResult] = Field(..., description="Validation results")
     blocked_commit: bool = Field(..., description="Whether commit was blocked")
     timestamp: str = Field(..., description="Timestamp of gate execution")
-    recovery_strategy: Optional[Dict[str, Any]] = Field(None, description="Applied recovery strategy")
+    recovery_strategy: Optional[RecoveryStrategy] = Field(
+        None, discriminator="type", description="Applied recovery strategy"
+    )
     crv_status: str = Field(..., description="CRV status: passed, blocked, or warning")
     failure_code: Optional[FailureTaxonomy] = Field(None, description="Failure code if failed")
     remediation: Optional[str] = Field(None, description="Remediation hint")
+
+    model_config = ConfigDict(frozen=True)
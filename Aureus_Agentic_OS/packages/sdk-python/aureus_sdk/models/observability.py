@@ -2,10 +2,13 @@
 Observability models matching the TypeScript telemetry types.
 """
 
+from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from aureus_sdk.models.common import InternedStr
 
 
 class TelemetryEventType(str, Enum):
@@ -34,22 +37,26 @@ class TelemetryEvent(BaseModel):
     """Telemetry event for tracking agent operations."""
 
     type: TelemetryEventType = Field(..., description="Event type")
-    timestamp: str = Field(..., description="Event timestamp")
-    workflow_id: Optional[str] = Field(None, description="Workflow identifier")
-    task_id: Optional[str] = Field(None, description="Task identifier")
-    task_type: Optional[str] = Field(None, description="Task type")
+    timestamp: datetime = Field(..., description="Event timestamp")
+    workflow_id: Optional[InternedStr] = Field(None, description="Workflow identifier")
+    task_id: Optional[InternedStr] = Field(None, description="Task identifier")
+    task_type: Optional[InternedStr] = Field(None, description="Task type")
     correlation_id: Optional[str] = Field(None, description="Correlation ID for distributed tracing")
     data: Dict[str, Any] = Field(..., description="Event data")
-    tags: Optional[Dict[str, str]] = Field(None, description="Event tags")
+    tags: Optional[Dict[InternedStr, str]] = Field(None, description="Event tags")
+
+    model_config = ConfigDict(frozen=True)
 
 
 class Metric(BaseModel):
     """Metric for observability."""
 
-    name: str = Field(..., description="Metric name")
+    name: InternedStr = Field(..., description="Metric name")
     value: float = Field(..., description="Metric value")
-    timestamp: str = Field(..., description="Metric timestamp")
-    tags: Optional[Dict[str, str]] = Field(None, description="Metric tags")
+    timestamp: datetime = Field(..., description="Metric timestamp")
+    tags: Optional[Dict[InternedStr, str]] = Field(None, description="Metric tags")
+
+    model_config = ConfigDict(frozen=True)
 
 
 class LogEntry(BaseModel):
@@ -71,5 +78,7 @@ class Span(BaseModel):
     start_time: str = Field(..., description="Start timestamp")
     end_time: Optional[str] = Field(None, description="End timestamp")
     duration: Optional[float] = Field(None, description="Duration in milliseconds")
-    tags: Optional[Dict[str, str]] = Field(None, description="Span tags")
+    tags: Optional[Dict[InternedStr, str]] = Field(None, description="Span tags")
     logs: Optional[List[LogEntry]] = Field(None, description="Span logs")
+
+    model_config = ConfigDict(frozen=True)
@@ -2,12 +2,65 @@
 Policy models matching the TypeScript policy types.
 """
 
+import threading
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from aureus_sdk.models.common import DataZone, Intent, Permission
+from aureus_sdk.models.common import DataZone, IdentifiedModel, Intent, Permission
+
+# Data zones from least to most sensitive, matching the goal-guard hierarchy
+DATA_ZONE_HIERARCHY = (
+    DataZone.PUBLIC,
+    DataZone.INTERNAL,
+    DataZone.CONFIDENTIAL,
+    DataZone.RESTRICTED,
+)
+_DATA_ZONE_LEVEL = {zone: level for level, zone in enumerate(DATA_ZONE_HIERARCHY)}
+
+PermissionIndex = Dict[Tuple[str, str], List[Permission]]
+
+# (action, resource) -> bit position, assigned on first sight and shared process-wide.
+# Capped so free-form resources (e.g. per-document paths) cannot grow the registry and
+# every mask without bound; pairs seen after the cap get no bit and are checked through
+# permission_index instead.
+_PERMISSION_BITS: Dict[Tuple[str, str], int] = {}
+_PERMISSION_BITS_MAX = 1024
+_PERMISSION_BITS_LOCK = threading.Lock()
+
+
+def _permission_bit(action: str, resource: str) -> Optional[int]:
+    """Get the mask bit for an (action, resource) pair, registering it if there is room."""
+    key = (action, resource)
+    bit = _PERMISSION_BITS.get(key)
+    if bit is None:
+        with _PERMISSION_BITS_LOCK:
+            bit = _PERMISSION_BITS.get(key)
+            if bit is None:
+                if len(_PERMISSION_BITS) >= _PERMISSION_BITS_MAX:
+                    return None
+                bit = _PERMISSION_BITS[key] = len(_PERMISSION_BITS)
+    return 1 << bit
+
+
+def _permission_mask(permissions: List[Permission]) -> Tuple[int, bool]:
+    """
+    OR together the bits of every permission's (action, resource) pair.
+    
+    Returns:
+        The mask and whether every pair has a bit
+    """
+    mask = 0
+    complete = True
+    for permission in permissions:
+        bit = _permission_bit(permission.action, permission.resource)
+        if bit is None:
+            complete = False
+        else:
+            mask |= bit
+    return mask, complete
 
 
 class PolicyRiskTier(str, Enum):
@@ -29,7 +82,7 @@ class GoalGuardState(str, Enum):
     PENDING_HUMAN = "pending_human"
 
 
-class Action(BaseModel):
+class Action(IdentifiedModel):
     """Action definition with risk classification."""
 
     id: str = Field(..., description="Action identifier")
@@ -41,6 +94,28 @@ class Action(BaseModel):
     allowed_tools: Optional[List[str]] = Field(None, description="Allowed tools")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
 
+    # (copy of required_permissions, mask or None if a pair has no bit, whether any
+    # requirement has an intent/data zone); rebuilt when the permissions change
+    _required_mask: Optional[Tuple[List[Permission], Optional[int], bool]] = PrivateAttr(None)
+
+    @property
+    def required_mask(self) -> Optional[int]:
+        """
+        Bitmask of the required (action, resource) pairs, built on first use.
+        
+        None when some pair could not be given a bit (the registry is full).
+        """
+        return self._required_mask_info()[1]
+
+    def _required_mask_info(self) -> Tuple[List[Permission], Optional[int], bool]:
+        cached = self._required_mask
+        if cached is None or cached[0] != self.required_permissions:
+            required = list(self.required_permissions)
+            mask, complete = _permission_mask(required)
+            constrained = any(p.intent or p.data_zone for p in required)
+            cached = self._required_mask = (required, mask if complete else None, constrained)
+        return cached
+
 
 class GuardDecision(BaseModel):
     """Goal-guard decision result."""
@@ -52,13 +127,82 @@ class GuardDecision(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
 
 
-class Principal(BaseModel):
+class Principal(IdentifiedModel):
     """Principal (actor) attempting an action."""
 
     id: str = Field(..., description="Principal identifier")
     type: str = Field(..., description="Principal type: agent, human, or service")
     permissions: List[Permission] = Field(..., description="Principal permissions")
 
+    # Lookup caches keyed on a copy of permissions, so in-place edits rebuild them
+    _permission_index: Optional[Tuple[List[Permission], PermissionIndex]] = PrivateAttr(None)
+    _permission_mask: Optional[Tuple[List[Permission], int]] = PrivateAttr(None)
+
+    @property
+    def permission_index(self) -> PermissionIndex:
+        """Permissions grouped by ``(action, resource)``, built on first use."""
+        cached = self._permission_index
+        if cached is None or cached[0] != self.permissions:
+            permissions = list(self.permissions)
+            index: PermissionIndex = {}
+            for permission in permissions:
+                index.setdefault((permission.action, permission.resource), []).append(permission)
+            cached = self._permission_index = (permissions, index)
+        return cached[1]
+
+    @property
+    def permission_mask(self) -> int:
+        """
+        Bitmask of the held (action, resource) pairs, built on first use.
+        
+        Pairs without a bit (registered after the registry filled up) are left out;
+        required masks containing such pairs are never compared against it.
+        """
+        cached = self._permission_mask
+        if cached is None or cached[0] != self.permissions:
+            permissions = list(self.permissions)
+            cached = self._permission_mask = (permissions, _permission_mask(permissions)[0])
+        return cached[1]
+
+    def has_permissions(self, action: "Action") -> bool:
+        """
+        Check locally whether this principal holds every permission an action requires.
+        
+        Applies the same matching rules as the goal-guard: action and resource must
+        match, intents must agree when both are set, and the principal's data zone
+        must be at or above the required one. The server remains authoritative.
+        
+        Args:
+            action: Action to check
+            
+        Returns:
+            True if every required permission is granted
+        """
+        _, required_mask, constrained = action._required_mask_info()
+        # One AND rejects any missing (action, resource) pair; without intent or
+        # data zone requirements a full match is already a grant
+        if required_mask is not None:
+            if required_mask & ~self.permission_mask:
+                return False
+            if not constrained:
+                return True
+        
+        index = self.permission_index
+        for required in action.required_permissions:
+            candidates = index.get((required.action, required.resource))
+            if not candidates or not any(_satisfies(p, required) for p in candidates):
+                return False
+        return True
+
+
+def _satisfies(granted: Permission, required: Permission) -> bool:
+    """Whether a granted permission covers a required one with the same action and resource."""
+    if required.intent and granted.intent and granted.intent != required.intent:
+        return False
+    if required.data_zone and granted.data_zone:
+        return _DATA_ZONE_LEVEL[granted.data_zone] >= _DATA_ZONE_LEVEL[required.data_zone]
+    return True
+
 
 class StateTransition(BaseModel):
     """State transition information."""
@@ -72,7 +216,7 @@ class StateTransition(BaseModel):
 class AuditEntry(BaseModel):
     """Audit entry for action tracking."""
 
-    timestamp: str = Field(..., description="Timestamp of entry")
+    timestamp: datetime = Field(..., description="Timestamp of entry")
     principal: Principal = Field(..., description="Principal who performed action")
     action: Action = Field(..., description="Action performed")
     decision: GuardDecision = Field(..., description="Guard decision")
@@ -81,13 +225,49 @@ class AuditEntry(BaseModel):
 
 
 class PolicyContext(BaseModel):
-    """Context for policy evaluation."""
+    """
+    Context for policy evaluation.
+    
+    Pass audit_log_maxlen to keep only the most recent audit entries, so
+    long-running agents recording into one context hold a bounded log.
+    """
 
     principal: Principal = Field(..., description="Principal requesting action")
     action: Action = Field(..., description="Action to evaluate")
     current_state: GoalGuardState = Field(..., description="Current guard state")
     audit_log: List[AuditEntry] = Field(..., description="Audit log entries")
 
+    # Maximum audit entries kept by this context; None keeps the full history
+    _audit_log_maxlen: Optional[int] = PrivateAttr(None)
+
+    def __init__(self, audit_log_maxlen: Optional[int] = None, **data: Any) -> None:
+        """
+        Initialize the policy context.
+        
+        Args:
+            audit_log_maxlen: Optional cap on audit entries; the oldest are dropped
+                first, both from the initial audit_log and by record_audit()
+            **data: PolicyContext fields
+        """
+        if audit_log_maxlen is not None and audit_log_maxlen < 1:
+            raise ValueError("audit_log_maxlen must be at least 1")
+        super().__init__(**data)
+        self._audit_log_maxlen = audit_log_maxlen
+        if audit_log_maxlen is not None and len(self.audit_log) > audit_log_maxlen:
+            del self.audit_log[:-audit_log_maxlen]
+
+    def record_audit(self, entry: AuditEntry) -> None:
+        """
+        Append an audit entry, dropping the oldest one if the log is at its cap.
+        
+        Args:
+            entry: Audit entry to record
+        """
+        self.audit_log.append(entry)
+        maxlen = self._audit_log_maxlen
+        if maxlen is not None and len(self.audit_log) > maxlen:
+            del self.audit_log[0]
+
 
 class ApprovalToken(BaseModel):
     """Approval token for HIGH/CRITICAL risk actions."""
@@ -95,5 +275,5 @@ class ApprovalToken(BaseModel):
     token: str = Field(..., description="Token string")
     action_id: str = Field(..., description="Action identifier")
     principal: Principal = Field(..., description="Principal who requested")
-    expires_at: str = Field(..., description="Expiration timestamp")
+    expires_at: datetime = Field(..., description="Expiration timestamp")
     used: bool = Field(..., description="Whether token has been used")
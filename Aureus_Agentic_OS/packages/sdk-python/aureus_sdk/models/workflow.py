@@ -2,12 +2,21 @@
 Workflow specification models matching the TypeScript WorkflowSpec schema.
 """
 
+from array import array
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from aureus_sdk.models.common import DataZone, Intent, Permission, RiskTier
+from aureus_sdk.models.common import (
+    DataZone,
+    IdentifiedModel,
+    Intent,
+    InternedStr,
+    Permission,
+    RiskTier,
+)
 
 
 class SandboxType(str, Enum):
@@ -60,10 +69,10 @@ class SandboxConfig(BaseModel):
     permissions: Optional[Dict[str, Any]] = Field(None, description="Sandbox permissions")
 
 
-class TaskSpec(BaseModel):
+class TaskSpec(IdentifiedModel):
     """Task specification within a workflow."""
 
-    id: str = Field(..., description="Unique task identifier")
+    id: InternedStr = Field(..., description="Unique task identifier")
     name: str = Field(..., description="Task name")
     type: TaskType = Field(..., description="Task type")
     inputs: Optional[Dict[str, Any]] = Field(None, description="Task inputs")
@@ -75,7 +84,7 @@ class TaskSpec(BaseModel):
     compensation_action: Optional[CompensationAction] = Field(
         None, description="Compensation action"
     )
-    tool_name: Optional[str] = Field(None, description="Tool name to execute")
+    tool_name: Optional[InternedStr] = Field(None, description="Tool name to execute")
     required_permissions: Optional[List[Permission]] = Field(
         None, description="Required permissions"
     )
@@ -84,6 +93,35 @@ class TaskSpec(BaseModel):
     data_zone: Optional[DataZone] = Field(None, description="Data zone")
     sandbox_config: Optional[SandboxConfig] = Field(None, description="Sandbox configuration")
 
+    @classmethod
+    def intern(cls, **kwargs: Any) -> "TaskSpec":
+        """
+        Build a task, reusing the instance already validated for identical arguments.
+        
+        Useful when the same task shapes are rebuilt for every workflow run. Calls are
+        cached only when every argument is a scalar (string, number, bool, enum or
+        None); anything else, including tuples that would become shared mutable lists,
+        is validated as usual. The returned (frozen) instance is shared between callers.
+        
+        Args:
+            **kwargs: TaskSpec fields
+            
+        Returns:
+            Validated TaskSpec
+        """
+        if all(value is None or isinstance(value, _SCALARS) for value in kwargs.values()):
+            return _intern_task(cls, tuple(sorted(kwargs.items())))
+        return cls(**kwargs)
+
+
+# Argument types TaskSpec.intern may cache on (bool and IntEnum are covered by int)
+_SCALARS = (str, int, float, Enum)
+
+
+@lru_cache(maxsize=4096)
+def _intern_task(cls: Type[TaskSpec], fields: Tuple[Tuple[str, Any], ...]) -> TaskSpec:
+    return cls(**dict(fields))
+
 
 class SafetyRule(BaseModel):
     """Safety rule for workflow validation."""
@@ -100,6 +138,34 @@ class SafetyPolicy(BaseModel):
     rules: List[SafetyRule] = Field(..., description="Safety rules")
     fail_fast: Optional[bool] = Field(None, description="Fail fast on rule violation")
 
+    # rule type -> rules, cached with a (rule, type) snapshot so edits made after
+    # validation, including in-place type changes on a rule, rebuild it
+    _rule_index: Optional[
+        Tuple[List[Tuple[SafetyRule, str]], Dict[str, List[SafetyRule]]]
+    ] = PrivateAttr(None)
+
+    def rules_of_type(self, rule_type: str) -> List[SafetyRule]:
+        """
+        Get the rules of a given type, in declaration order.
+        
+        The index is checked for staleness against every rule, so each call is still
+        O(len(rules)); what it saves is re-grouping the rules on repeated lookups.
+        
+        Args:
+            rule_type: Rule type to match
+            
+        Returns:
+            Matching rules (empty if none)
+        """
+        snapshot = [(rule, rule.type) for rule in self.rules]
+        cached = self._rule_index
+        if cached is None or cached[0] != snapshot:
+            rule_index: Dict[str, List[SafetyRule]] = {}
+            for rule in self.rules:
+                rule_index.setdefault(rule.type, []).append(rule)
+            cached = self._rule_index = (snapshot, rule_index)
+        return list(cached[1].get(rule_type, ()))
+
 
 class WorkflowSpec(BaseModel):
     """
@@ -120,6 +186,63 @@ class WorkflowSpec(BaseModel):
     )
     safety_policy: Optional[SafetyPolicy] = Field(None, description="Safety policy")
 
+    # Flattened dependency graph: task_id -> position in tasks, plus (task, dependency)
+    # position pairs packed into one int array. Cached with shallow copies of tasks and
+    # dependencies so edits made after validation (in place or via model_copy) rebuild it.
+    _dependency_index: Optional[
+        Tuple[List[TaskSpec], Dict[str, List[str]], Dict[str, int], array]
+    ] = PrivateAttr(None)
+
+    def _indexed_dependencies(self) -> Tuple[Dict[str, int], array]:
+        """Get the integer dependency index, rebuilding it if tasks or dependencies changed."""
+        cached = self._dependency_index
+        if cached is not None and cached[0] == self.tasks and cached[1] == self.dependencies:
+            return cached[2], cached[3]
+        
+        task_index = {task.id: i for i, task in enumerate(self.tasks)}
+        edges = array("i")
+        for task_id, depends_on in self.dependencies.items():
+            task_pos = task_index.get(task_id)
+            if task_pos is None:
+                continue
+            for dependency_id in depends_on:
+                dependency_pos = task_index.get(dependency_id)
+                if dependency_pos is not None:
+                    edges.append(task_pos)
+                    edges.append(dependency_pos)
+        self._dependency_index = (
+            list(self.tasks),
+            {task_id: list(depends_on) for task_id, depends_on in self.dependencies.items()},
+            task_index,
+            edges,
+        )
+        return task_index, edges
+
+    def task_position(self, task_id: str) -> int:
+        """
+        Get the position of a task in ``tasks``.
+        
+        Args:
+            task_id: Task identifier
+            
+        Returns:
+            Index into ``tasks``
+            
+        Raises:
+            KeyError: If no task has this ID
+        """
+        return self._indexed_dependencies()[0][task_id]
+
+    def iter_dependencies(self) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate dependency edges as ``(task, dependency)`` positions in ``tasks``.
+        
+        Entries in ``dependencies`` that reference unknown task IDs are skipped.
+        """
+        edges = self._indexed_dependencies()[1]
+        for i in range(0, len(edges), 2):
+            yield edges[i], edges[i + 1]
+
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -49,8 +49,9 @@ async def main():
                 "No data loss",
                 "All validations pass",
             ],
+            # TaskSpec.intern reuses the validated task when the same shape is rebuilt
             tasks=[
-                TaskSpec(
+                TaskSpec.intern(
                     id="read-input",
                     name="Read Input Data",
                     type=TaskType.ACTION,
@@ -59,7 +60,7 @@ async def main():
                     intent=Intent.READ,
                     data_zone=DataZone.INTERNAL,
                 ),
-                TaskSpec(
+                TaskSpec.intern(
                     id="validate-schema",
                     name="Validate Data Schema",
                     type=TaskType.ACTION,
@@ -67,7 +68,7 @@ async def main():
                     risk_tier=RiskTier.LOW,
                     intent=Intent.READ,
                 ),
-                TaskSpec(
+                TaskSpec.intern(
                     id="transform-data",
                     name="Transform Data",
                     type=TaskType.ACTION,
@@ -76,7 +77,7 @@ async def main():
                     intent=Intent.WRITE,
                     timeout_ms=30000,
                 ),
-                TaskSpec(
+                TaskSpec.intern(
                     id="save-output",
                     name="Save Output Data",
                     type=TaskType.ACTION,
@@ -121,7 +122,7 @@ async def main():
         print("\n→ Reporting telemetry event...")
         event = TelemetryEvent(
             type=TelemetryEventType.STEP_START,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=datetime.utcnow(),
             workflow_id="example-data-processing",
             task_id="read-input",
             task_type=TaskType.ACTION.value,
@@ -147,7 +148,7 @@ async def main():
         metric = Metric(
             name="task.duration",
             value=1234.5,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=datetime.utcnow(),
             tags={
                 "workflow_id": "example-data-processing",
                 "task_id": "read-input",
@@ -0,0 +1,24 @@
+"""
+Shared pytest configuration for the SDK tests.
+"""
+
+import os
+
+import pytest
+from pydantic import BaseModel
+
+import aureus_sdk
+
+# Skip rendering documentation URLs into ValidationError messages
+os.environ.setdefault("PYDANTIC_ERRORS_INCLUDE_URL", "0")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_schemas():
+    """Build every exported model's validator and serializer before the first test."""
+    for name in aureus_sdk.__all__:
+        model = getattr(aureus_sdk, name)
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            assert model.__pydantic_complete__, f"{name} schema was not built"
+            _ = model.__pydantic_validator__
+            _ = model.__pydantic_serializer__
@@ -2,14 +2,16 @@
 Tests for client functionality.
 """
 
+import asyncio
 import json
-from unittest.mock import Mock, patch
+from datetime import datetime, timezone
 
 import httpx
 import pytest
 
 from aureus_sdk import (
     AureusClient,
+    AureusSyncClient,
     Commit,
     GateConfig,
     Metric,
@@ -21,10 +23,51 @@ from aureus_sdk import (
 )
 
 
-@pytest.fixture
-def client():
-    """Create a test client."""
-    return AureusClient(base_url="http://localhost:3000", timeout=10.0)
+class FakeAureusAPI:
+    """MockTransport handler returning canned JSON per (method, path) and recording requests."""
+
+    def __init__(self):
+        self.requests = []
+        self.responses = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json=self.responses.get((request.method, request.url.path), {}))
+
+
+@pytest.fixture(scope="module")
+def fake_api():
+    """Create the fake API shared by the module's clients."""
+    return FakeAureusAPI()
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_api(fake_api):
+    """Forget recorded requests and canned responses between tests."""
+    yield
+    fake_api.requests.clear()
+    fake_api.responses.clear()
+
+
+@pytest.fixture(scope="module")
+def client(fake_api):
+    """Create a test client reused across the module, closed after its last test."""
+    client = AureusClient(
+        base_url="http://localhost:3000",
+        timeout=10.0,
+        transport=httpx.MockTransport(fake_api),
+    )
+    yield client
+    asyncio.run(client.close())
+
+
+def make_client(fake_api, **kwargs):
+    """Create a dedicated client backed by the fake API."""
+    return AureusClient(
+        base_url="http://localhost:3000",
+        transport=httpx.MockTransport(fake_api),
+        **kwargs,
+    )
 
 
 @pytest.fixture
@@ -67,57 +110,103 @@ async def test_client_with_api_key():
 
 
 @pytest.mark.asyncio
-async def test_execute_workflow(client, sample_workflow):
+async def test_shared_client_is_reused():
+    """Test shared clients are cached per base URL and API key."""
+    shared = AureusClient.shared(base_url="http://localhost:3000/")
+    
+    assert AureusClient.shared(base_url="http://localhost:3000") is shared
+    assert AureusClient.shared(base_url="http://localhost:3000", api_key="k") is not shared
+    
+    # close() must not tear down the pool other callers are using
+    await shared.close()
+    assert not shared._client.is_closed
+    
+    await AureusClient.close_shared()
+    assert shared._client.is_closed
+    assert AureusClient.shared(base_url="http://localhost:3000") is not shared
+    await AureusClient.close_shared()
+
+
+def test_shared_client_per_event_loop():
+    """Test each event loop gets its own shared client."""
+    
+    async def use_shared():
+        shared = AureusClient.shared(
+            base_url="http://localhost:3000",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        )
+        assert AureusClient.shared(base_url="http://localhost:3000") is shared
+        await shared.get_workflow_status("w")
+        await AureusClient.close_shared()
+        return shared
+    
+    first = asyncio.run(use_shared())
+    second = asyncio.run(use_shared())
+    
+    assert first is not second
+    assert first._client.is_closed
+    
+    with pytest.raises(RuntimeError):
+        AureusClient.shared(base_url="http://localhost:3000")
+
+
+@pytest.mark.asyncio
+async def test_injected_client_not_closed():
+    """Test an injected httpx client is reused and left open."""
+    http_client = httpx.AsyncClient(base_url="http://localhost:3000")
+    client = AureusClient(client=http_client)
+    
+    assert client._client is http_client
+    
+    await client.close()
+    assert not http_client.is_closed
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_execute_workflow(client, fake_api, sample_workflow):
     """Test workflow execution."""
-    with patch.object(client._client, "post") as mock_post:
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "workflow_id": "test-workflow",
-            "status": "success",
-            "task_results": {
-                "task1": {
-                    "task_id": "task1",
-                    "status": "success",
-                    "duration_ms": 100.0,
-                }
-            },
-            "duration_ms": 100.0,
-        }
-        mock_post.return_value = mock_response
-        
-        result = await client.execute_workflow(sample_workflow)
-        
-        assert result.workflow_id == "test-workflow"
-        assert result.status == "success"
-        assert "task1" in result.task_results
-        
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert call_args[1]["json"]["workflow"]["id"] == "test-workflow"
+    fake_api.responses["POST", "/api/v1/workflows/execute"] = {
+        "workflow_id": "test-workflow",
+        "status": "success",
+        "task_results": {
+            "task1": {
+                "task_id": "task1",
+                "status": "success",
+                "duration_ms": 100.0,
+            }
+        },
+        "duration_ms": 100.0,
+    }
+    
+    result = await client.execute_workflow(sample_workflow)
+    
+    assert result.workflow_id == "test-workflow"
+    assert result.status == "success"
+    assert "task1" in result.task_results
+    
+    assert len(fake_api.requests) == 1
+    assert json.loads(fake_api.requests[0].content)["workflow"]["id"] == "test-workflow"
 
 
 @pytest.mark.asyncio
-async def test_get_workflow_status(client):
+async def test_get_workflow_status(client, fake_api):
     """Test getting workflow status."""
-    with patch.object(client._client, "get") as mock_get:
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "workflow_id": "test-workflow",
-            "status": "running",
-            "progress": 0.5,
-        }
-        mock_get.return_value = mock_response
-        
-        status = await client.get_workflow_status("test-workflow")
-        
-        assert status["workflow_id"] == "test-workflow"
-        assert status["status"] == "running"
-        
-        mock_get.assert_called_once_with("/api/v1/workflows/test-workflow/status")
+    fake_api.responses["GET", "/api/v1/workflows/test-workflow/status"] = {
+        "workflow_id": "test-workflow",
+        "status": "running",
+        "progress": 0.5,
+    }
+    
+    status = await client.get_workflow_status("test-workflow")
+    
+    assert status["workflow_id"] == "test-workflow"
+    assert status["status"] == "running"
+    assert len(fake_api.requests) == 1
 
 
 @pytest.mark.asyncio
-async def test_validate_commit(client):
+async def test_validate_commit(client, fake_api):
     """Test CRV commit validation."""
     commit = Commit(
         id="commit-123",
@@ -130,29 +219,30 @@ async def test_validate_commit(client):
         block_on_failure=True,
     )
     
-    with patch.object(client._client, "post") as mock_post:
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "passed": True,
-            "gate_name": "Test Gate",
-            "validation_results": [
-                {"valid": True, "reason": "All checks passed"}
-            ],
-            "blocked_commit": False,
-            "timestamp": "2024-01-01T00:00:00Z",
-            "crv_status": "passed",
-        }
-        mock_post.return_value = mock_response
-        
-        result = await client.validate_commit(commit, gate_config)
-        
-        assert result.passed is True
-        assert result.gate_name == "Test Gate"
-        assert result.crv_status == "passed"
+    fake_api.responses["POST", "/api/v1/crv/validate"] = {
+        "passed": True,
+        "gate_name": "Test Gate",
+        "validation_results": [
+            {"valid": True, "reason": "All checks passed"}
+        ],
+        "blocked_commit": False,
+        "timestamp": "2024-01-01T00:00:00Z",
+        "crv_status": "passed",
+    }
+    
+    result = await client.validate_commit(commit, gate_config)
+    
+    assert result.passed is True
+    assert result.gate_name == "Test Gate"
+    assert result.crv_status == "passed"
+    
+    payload = json.loads(fake_api.requests[0].content)
+    assert payload["commit"] == commit.model_dump(mode="json")
+    assert payload["gate_config"]["validators"] == ["not_null"]
 
 
 @pytest.mark.asyncio
-async def test_report_event(client):
+async def test_report_event(client, fake_api):
     """Test reporting telemetry event."""
     event = TelemetryEvent(
         type=TelemetryEventType.STEP_START,
@@ -161,19 +251,13 @@ async def test_report_event(client):
         data={"step": "start"},
     )
     
-    with patch.object(client._client, "post") as mock_post:
-        mock_response = Mock()
-        mock_post.return_value = mock_response
-        
-        await client.report_event(event)
-        
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert call_args[0][0] == "/api/v1/observability/events"
+    await client.report_event(event)
+    
+    assert [r.url.path for r in fake_api.requests] == ["/api/v1/observability/events"]
 
 
 @pytest.mark.asyncio
-async def test_report_metric(client):
+async def test_report_metric(client, fake_api):
     """Test reporting metric."""
     metric = Metric(
         name="task.duration",
@@ -182,44 +266,226 @@ async def test_report_metric(client):
         tags={"workflow_id": "test-workflow"},
     )
     
-    with patch.object(client._client, "post") as mock_post:
-        mock_response = Mock()
-        mock_post.return_value = mock_response
-        
+    await client.report_metric(metric)
+    
+    assert [r.url.path for r in fake_api.requests] == ["/api/v1/observability/metrics"]
+    assert json.loads(fake_api.requests[0].content)["timestamp"] == "2024-01-01T00:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_report_metric_msgpack(fake_api):
+    """Test reporting a metric with the msgpack wire format."""
+    msgpack = pytest.importorskip("msgpack")
+    client = make_client(fake_api, wire_format="msgpack")
+    metric = Metric(name="task.duration", value=1.5, timestamp="2024-01-01T00:00:00Z")
+    
+    await client.report_metric(metric)
+    
+    request = fake_api.requests[0]
+    assert request.url.path == "/api/v1/observability/metrics"
+    assert request.headers["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(request.content)["name"] == "task.duration"
+    
+    await client.close()
+
+
+def test_invalid_wire_format():
+    """Test unknown wire formats are rejected."""
+    with pytest.raises(ValueError):
+        AureusClient(wire_format="xml")
+
+
+@pytest.mark.asyncio
+async def test_report_metric_batched(fake_api):
+    """Test batched metrics are sent as one request when the batch fills."""
+    client = make_client(fake_api, batch_telemetry=True, batch_max_items=3)
+    metrics = [
+        Metric(name="task.duration", value=float(i), timestamp="2024-01-01T00:00:00Z")
+        for i in range(3)
+    ]
+    
+    await client.report_metric(metrics[0])
+    await client.report_metric(metrics[1])
+    assert fake_api.requests == []
+    
+    await client.report_metric(metrics[2])
+    
+    assert [r.url.path for r in fake_api.requests] == ["/api/v1/observability/metrics:batch"]
+    assert [m["value"] for m in json.loads(fake_api.requests[0].content)] == [0.0, 1.0, 2.0]
+    
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_report_event_batch_flushes_on_interval(fake_api):
+    """Test a partial batch is sent after the flush interval."""
+    client = make_client(fake_api, batch_telemetry=True, batch_flush_interval=0.01)
+    event = TelemetryEvent(
+        type=TelemetryEventType.STEP_START,
+        timestamp="2024-01-01T00:00:00Z",
+        data={"step": "start"},
+    )
+    
+    await client.report_event(event)
+    assert fake_api.requests == []
+    
+    await asyncio.sleep(0.05)
+    
+    assert [r.url.path for r in fake_api.requests] == ["/api/v1/observability/events:batch"]
+    assert len(json.loads(fake_api.requests[0].content)) == 1
+    
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_batched_telemetry(fake_api):
+    """Test closing the client sends buffered telemetry."""
+    client = make_client(fake_api, batch_telemetry=True)
+    event = TelemetryEvent(
+        type=TelemetryEventType.STEP_END,
+        timestamp="2024-01-01T00:00:00Z",
+        data={},
+    )
+    
+    await client.report_event(event)
+    await client.close()
+    
+    assert [r.url.path for r in fake_api.requests] == ["/api/v1/observability/events:batch"]
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_timer_batch_in_flight():
+    """Test closing the client waits for a batch the flush timer already started sending."""
+    delivered = []
+    
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        delivered.append(request.url.path)
+        return httpx.Response(200, json={})
+    
+    metric = Metric(name="task.duration", value=1.5, timestamp="2024-01-01T00:00:00Z")
+    async with AureusClient(
+        base_url="http://localhost:3000",
+        transport=httpx.MockTransport(slow_handler),
+        batch_telemetry=True,
+        batch_flush_interval=0.01,
+    ) as client:
         await client.report_metric(metric)
-        
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert call_args[0][0] == "/api/v1/observability/metrics"
+        await asyncio.sleep(0.02)
+        assert delivered == []
+    
+    assert delivered == ["/api/v1/observability/metrics:batch"]
 
 
 @pytest.mark.asyncio
-async def test_get_metrics(client):
+async def test_get_metrics(client, fake_api):
     """Test querying metrics."""
-    with patch.object(client._client, "get") as mock_get:
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "name": "task.duration",
-                "value": 123.45,
-                "timestamp": "2024-01-01T00:00:00Z",
-                "tags": {"workflow_id": "test-workflow"},
-            }
-        ]
-        mock_get.return_value = mock_response
-        
-        metrics = await client.get_metrics(
-            metric_name="task.duration",
-            tags={"workflow_id": "test-workflow"},
-        )
-        
-        assert len(metrics) == 1
-        assert metrics[0].name == "task.duration"
-        assert metrics[0].value == 123.45
+    fake_api.responses["GET", "/api/v1/observability/metrics"] = [
+        {
+            "name": "task.duration",
+            "value": 123.45,
+            "timestamp": "2024-01-01T00:00:00Z",
+            "tags": {"workflow_id": "test-workflow"},
+        }
+    ]
+    
+    metrics = await client.get_metrics(
+        metric_name="task.duration",
+        tags={"workflow_id": "test-workflow"},
+    )
+    
+    assert len(metrics) == 1
+    assert metrics[0].name == "task.duration"
+    assert metrics[0].value == 123.45
+    assert metrics[0].timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert fake_api.requests[0].url.params["name"] == "task.duration"
+
+
+@pytest.mark.asyncio
+async def test_get_trace(client, fake_api):
+    """Test fetching a trace."""
+    fake_api.responses["GET", "/api/v1/observability/traces/trace-123"] = [
+        {
+            "id": "span-1",
+            "trace_id": "trace-123",
+            "name": "workflow.execute",
+            "start_time": "2024-01-01T00:00:00Z",
+        },
+        {
+            "id": "span-2",
+            "trace_id": "trace-123",
+            "parent_id": "span-1",
+            "name": "task.execute",
+            "start_time": "2024-01-01T00:00:01Z",
+            "logs": [
+                {"timestamp": "2024-01-01T00:00:01Z", "level": "info", "message": "started"}
+            ],
+        },
+    ]
+    
+    spans = await client.get_trace("trace-123")
+    
+    assert [span.id for span in spans] == ["span-1", "span-2"]
+    assert spans[1].parent_id == "span-1"
+    assert spans[1].logs[0].message == "started"
+    assert len(fake_api.requests) == 1
 
 
 @pytest.mark.asyncio
-async def test_check_permission(client):
+async def test_evaluate_policy_body(client, fake_api):
+    """Test policy contexts are sent with field names, as model_dump_json() emits them."""
+    from aureus_sdk import (
+        Action,
+        AuditEntry,
+        GoalGuardState,
+        GuardDecision,
+        PolicyContext,
+        PolicyRiskTier,
+        Principal,
+    )
+    from aureus_sdk.models.policy import StateTransition
+    
+    principal = Principal(id="user-001", type="human", permissions=[])
+    action = Action(
+        id="read-data",
+        name="Read Data",
+        risk_tier=PolicyRiskTier.LOW,
+        required_permissions=[],
+    )
+    entry = AuditEntry(
+        timestamp="2024-01-01T00:00:00Z",
+        principal=principal,
+        action=action,
+        decision=GuardDecision(allowed=True, reason="ok", requires_human_approval=False),
+        state_transition=StateTransition(
+            from_state=GoalGuardState.IDLE,
+            to_state=GoalGuardState.EVALUATING,
+        ),
+    )
+    context = PolicyContext(
+        principal=principal,
+        action=action,
+        current_state=GoalGuardState.IDLE,
+        audit_log=[entry],
+    )
+    fake_api.responses["POST", "/api/v1/policy/evaluate"] = {
+        "allowed": True,
+        "reason": "ok",
+        "requires_human_approval": False,
+    }
+    
+    await client.evaluate_policy(context)
+    
+    body = json.loads(fake_api.requests[0].content)
+    assert body == json.loads(context.model_dump_json())
+    assert body["audit_log"][0]["state_transition"] == {
+        "from_state": "idle",
+        "to_state": "evaluating",
+    }
+
+
+@pytest.mark.asyncio
+async def test_check_permission(client, fake_api):
     """Test checking permission."""
     from aureus_sdk import Action, Permission, Principal, PolicyRiskTier
     
@@ -236,19 +502,84 @@ async def test_check_permission(client):
         required_permissions=[],
     )
     
-    with patch.object(client._client, "post") as mock_post:
-        mock_response = Mock()
-        mock_response.json.return_value = {"allowed": True}
-        mock_post.return_value = mock_response
-        
-        allowed = await client.check_permission(principal, action)
-        
-        assert allowed is True
+    fake_api.responses["POST", "/api/v1/policy/check"] = {"allowed": True}
+    
+    allowed = await client.check_permission(principal, action)
+    
+    assert allowed is True
 
 
 @pytest.mark.asyncio
-async def test_close_client(client):
+async def test_check_permission_caches_denials(fake_api):
+    """Test denied permission checks are answered from the deny cache."""
+    from aureus_sdk import Action, Principal, PolicyRiskTier
+    
+    client = make_client(fake_api, deny_cache_size=8)
+    principal = Principal(id="user-001", type="human", permissions=[])
+    action = Action(
+        id="delete-data",
+        name="Delete Data",
+        risk_tier=PolicyRiskTier.HIGH,
+        required_permissions=[],
+    )
+    
+    fake_api.responses["POST", "/api/v1/policy/check"] = {"allowed": False}
+    
+    assert await client.check_permission(principal, action) is False
+    assert await client.check_permission(principal, action) is False
+    assert len(fake_api.requests) == 1
+    
+    client.clear_permission_cache(principal_id="user-001")
+    fake_api.responses["POST", "/api/v1/policy/check"] = {"allowed": True}
+    
+    assert await client.check_permission(principal, action) is True
+    assert await client.check_permission(principal, action) is True
+    assert len(fake_api.requests) == 3
+    
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_close_client(fake_api):
     """Test closing the client."""
-    with patch.object(client._client, "aclose") as mock_close:
-        await client.close()
-        mock_close.assert_called_once()
+    client = make_client(fake_api)
+    
+    await client.close()
+    
+    assert client._client.is_closed
+
+
+def test_sync_client_execute_workflow(sample_workflow):
+    """Test workflow execution with the synchronous client."""
+    seen = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200,
+            json={"workflow_id": "test-workflow", "status": "success", "task_results": {}},
+        )
+    
+    http_client = httpx.Client(
+        base_url="http://localhost:3000",
+        transport=httpx.MockTransport(handler),
+    )
+    with AureusSyncClient(client=http_client) as client:
+        result = client.execute_workflow(sample_workflow, correlation_id="trace-1")
+    
+    assert result.workflow_id == "test-workflow"
+    assert seen[0].url.path == "/api/v1/workflows/execute"
+    body = json.loads(seen[0].content)
+    assert body["workflow"]["id"] == "test-workflow"
+    assert body["correlation_id"] == "trace-1"
+    http_client.close()
+
+
+def test_sync_client_with_api_key():
+    """Test the synchronous client shares header configuration."""
+    with AureusSyncClient(base_url="http://localhost:3000/", api_key="test-key") as client:
+        assert client.base_url == "http://localhost:3000"
+        assert client.headers["Authorization"] == "Bearer test-key"
+        assert client._client.headers["Authorization"] == "Bearer test-key"
+    
+    assert client._client.is_closed
@@ -3,6 +3,7 @@ Tests for CRV models.
 """
 
 import pytest
+from pydantic import ValidationError
 
 from aureus_sdk.models.crv import (
     AskUserStrategy,
@@ -33,6 +34,14 @@ def test_validation_result():
     assert result.metadata["checks_run"] == 5
 
 
+def test_validation_result_is_frozen():
+    """Test validation results are immutable."""
+    result = ValidationResult(valid=True)
+    
+    with pytest.raises(ValidationError):
+        result.valid = False
+
+
 def test_validation_result_with_failure():
     """Test validation result with failure."""
     result = ValidationResult(
@@ -147,16 +156,41 @@ def test_recovery_result():
     """Test recovery result."""
     result = RecoveryResult(
         success=True,
-        strategy={"type": "retry_alt_tool", "tool_name": "backup_tool"},
+        strategy={"type": "retry_alt_tool", "tool_name": "backup_tool", "max_retries": 2},
         message="Successfully recovered using alternative tool",
         recovered_data={"balance": 1000},
     )
     
     assert result.success is True
-    assert result.strategy["type"] == "retry_alt_tool"
+    assert isinstance(result.strategy, RetryAltToolStrategy)
+    assert result.strategy.tool_name == "backup_tool"
     assert result.recovered_data["balance"] == 1000
 
 
+def test_gate_config_recovery_strategy_discriminated():
+    """Test recovery strategies are selected by their type tag."""
+    config = GateConfig(
+        name="Validation Gate",
+        validators=["not_null"],
+        block_on_failure=True,
+        recovery_strategy={"type": "escalate", "reason": "Needs review"},
+    )
+    
+    assert isinstance(config.recovery_strategy, EscalateStrategy)
+    assert config.model_dump()["recovery_strategy"] == {
+        "type": "escalate",
+        "reason": "Needs review",
+    }
+    
+    with pytest.raises(ValidationError):
+        GateConfig(
+            name="Validation Gate",
+            validators=["not_null"],
+            block_on_failure=True,
+            recovery_strategy={"type": "unknown"},
+        )
+
+
 def test_failure_taxonomy_values():
     """Test failure taxonomy enum values."""
     assert FailureTaxonomy.MISSING_DATA.value == "MISSING_DATA"
@@ -189,6 +223,6 @@ def test_gate_config_serialization():
         block_on_failure=True,
     )
     
-    config_json = config.model_dump_json()
+    config_json = config.__pydantic_serializer__.to_json(config).decode()
     assert "Test Gate" in config_json
     assert "validator1" in config_json
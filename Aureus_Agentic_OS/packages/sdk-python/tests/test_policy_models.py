@@ -0,0 +1,224 @@
+"""
+Tests for policy models.
+"""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from aureus_sdk.models import policy
+from aureus_sdk.models.common import DataZone, Intent, Permission
+from aureus_sdk.models.policy import (
+    Action,
+    AuditEntry,
+    GoalGuardState,
+    GuardDecision,
+    PolicyContext,
+    PolicyRiskTier,
+    Principal,
+)
+
+
+def _action(*permissions: Permission) -> Action:
+    return Action(
+        id="action-1",
+        name="Test Action",
+        risk_tier=PolicyRiskTier.LOW,
+        required_permissions=list(permissions),
+    )
+
+
+def test_principal_permission_index():
+    """Test permissions are grouped by action and resource."""
+    principal = Principal(
+        id="agent-001",
+        type="agent",
+        permissions=[
+            Permission(action="read", resource="db", intent=Intent.READ),
+            Permission(action="read", resource="db", data_zone=DataZone.PUBLIC),
+            Permission(action="write", resource="db"),
+        ],
+    )
+    
+    index = principal.permission_index
+    
+    assert len(index[("read", "db")]) == 2
+    assert len(index[("write", "db")]) == 1
+    assert principal.permission_index is index
+
+
+def test_principal_has_permissions():
+    """Test local permission checks follow goal-guard matching rules."""
+    principal = Principal(
+        id="agent-001",
+        type="agent",
+        permissions=[
+            Permission(
+                action="read",
+                resource="db",
+                intent=Intent.READ,
+                data_zone=DataZone.CONFIDENTIAL,
+            ),
+        ],
+    )
+    
+    assert principal.has_permissions(_action())
+    assert principal.has_permissions(
+        _action(Permission(action="read", resource="db", data_zone=DataZone.INTERNAL))
+    )
+    assert not principal.has_permissions(
+        _action(Permission(action="read", resource="db", data_zone=DataZone.RESTRICTED))
+    )
+    assert not principal.has_permissions(
+        _action(Permission(action="read", resource="db", intent=Intent.WRITE))
+    )
+    assert not principal.has_permissions(_action(Permission(action="delete", resource="db")))
+
+
+def test_permission_masks():
+    """Test masks share bits per (action, resource) pair and gate has_permissions."""
+    principal = Principal(
+        id="agent-001",
+        type="agent",
+        permissions=[
+            Permission(action="read", resource="db", intent=Intent.READ),
+            Permission(action="write", resource="db"),
+        ],
+    )
+    read = _action(Permission(action="read", resource="db"))
+    
+    assert read.required_mask & principal.permission_mask == read.required_mask
+    assert _action().required_mask == 0
+    assert _action(Permission(action="delete", resource="db")).required_mask & (
+        principal.permission_mask
+    ) == 0
+    assert principal.has_permissions(read)
+    assert not principal.has_permissions(
+        _action(Permission(action="read", resource="db"), Permission(action="read", resource="s3"))
+    )
+
+
+def test_permission_bit_registry_is_bounded(monkeypatch):
+    """Test distinct resources past the cap fall back to index checks."""
+    monkeypatch.setattr(policy, "_PERMISSION_BITS", {})
+    monkeypatch.setattr(policy, "_PERMISSION_BITS_MAX", 4)
+    permissions = [Permission(action="read", resource=f"doc-{i}") for i in range(20)]
+    principal = Principal(id="agent-001", type="agent", permissions=permissions)
+    
+    assert principal.permission_mask.bit_length() <= 4
+    assert len(policy._PERMISSION_BITS) == 4
+    
+    late = _action(permissions[0], permissions[-1])
+    assert late.required_mask is None
+    assert principal.has_permissions(late)
+    assert not principal.has_permissions(
+        _action(permissions[0], Permission(action="read", resource="doc-99"))
+    )
+    assert len(policy._PERMISSION_BITS) == 4
+
+
+def test_principal_permission_index_follows_copies():
+    """Test the index is rebuilt when permissions are replaced."""
+    principal = Principal(
+        id="agent-001",
+        type="agent",
+        permissions=[Permission(action="read", resource="db")],
+    )
+    action = _action(Permission(action="write", resource="db"))
+    assert not principal.has_permissions(action)
+    
+    updated = principal.model_copy(
+        update={"permissions": [Permission(action="write", resource="db")]}
+    )
+    
+    assert updated.has_permissions(action)
+
+
+def test_frozen_models_hash_by_id():
+    """Test actions and principals are hashable value objects."""
+    principal = Principal(
+        id="agent-001",
+        type="agent",
+        permissions=[Permission(action="read", resource="db")],
+    )
+    same = Principal(
+        id="agent-001",
+        type="agent",
+        permissions=[Permission(action="read", resource="db")],
+    )
+    
+    # Lookup caches built by has_permissions do not affect equality
+    assert principal.has_permissions(_action(Permission(action="read", resource="db")))
+    assert principal == same
+    assert {principal, same} == {principal}
+    assert principal != principal.model_copy(update={"type": "service"})
+    assert {_action(): "seen"}[_action()] == "seen"
+    
+    with pytest.raises(ValidationError):
+        principal.id = "agent-002"
+
+
+def test_principal_caches_follow_in_place_edits():
+    """Test revoking or granting permissions in place is seen by later checks."""
+    principal = Principal(
+        id="agent-001",
+        type="agent",
+        permissions=[Permission(action="read", resource="db")],
+    )
+    read = _action(Permission(action="read", resource="db"))
+    assert principal.has_permissions(read)
+    
+    principal.permissions.clear()
+    assert not principal.has_permissions(read)
+    assert principal.permission_index == {}
+    
+    principal.permissions.append(Permission(action="read", resource="db"))
+    assert principal.has_permissions(read)
+    
+    read.required_permissions.append(Permission(action="write", resource="db"))
+    assert not principal.has_permissions(read)
+
+
+def test_policy_context_bounded_audit_log():
+    """Test the audit log keeps only the most recent entries when bounded."""
+    principal = Principal(id="agent-001", type="agent", permissions=[])
+    entries = [
+        AuditEntry(
+            timestamp="2024-01-01T00:00:00Z",
+            principal=principal,
+            action=_action(),
+            decision=GuardDecision(
+                allowed=True,
+                reason=f"entry {i}",
+                requires_human_approval=False,
+            ),
+        )
+        for i in range(3)
+    ]
+    
+    context = PolicyContext(
+        principal=principal,
+        action=_action(),
+        current_state=GoalGuardState.IDLE,
+        audit_log=entries,
+        audit_log_maxlen=2,
+    )
+    assert [entry.decision.reason for entry in context.audit_log] == ["entry 1", "entry 2"]
+    
+    context.record_audit(entries[0])
+    assert [entry.decision.reason for entry in context.audit_log] == ["entry 2", "entry 0"]
+    assert context.audit_log[-1:] == [entries[0]]
+    assert len(json.loads(context.model_dump_json())["audit_log"]) == 2
+    
+    # The bound is per instance
+    unbounded = PolicyContext(
+        principal=principal,
+        action=_action(),
+        current_state=GoalGuardState.IDLE,
+        audit_log=[],
+    )
+    assert unbounded.audit_log == []
+    for entry in entries:
+        unbounded.record_audit(entry)
+    assert len(unbounded.audit_log) == 3
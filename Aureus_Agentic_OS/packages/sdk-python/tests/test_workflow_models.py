@@ -2,8 +2,10 @@
 Tests for workflow models.
 """
 
+import json
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from aureus_sdk.models.workflow import (
     CompensationAction,
@@ -22,83 +24,147 @@ from aureus_sdk.models.workflow import (
     WorkflowSpec,
 )
 
+_WORKFLOW_ADAPTER = TypeAdapter(WorkflowSpec)
+
+
+def _expect_validation_error(cls, **kwargs):
+    """Construct cls with kwargs, asserting validation fails; returns the error."""
+    with pytest.raises(ValidationError) as exc_info:
+        cls(**kwargs)
+    return exc_info.value
+
+
+_BASE_TASK_DATA = {"id": "task1", "name": "First Task", "type": "action"}
+_BASE_WORKFLOW_DATA = {
+    "id": "test-workflow",
+    "name": "Test Workflow",
+    "tasks": [_BASE_TASK_DATA],
+    "dependencies": {"task1": []},
+}
+_BASE_WORKFLOW_JSON = json.dumps(_BASE_WORKFLOW_DATA).encode()
+
+
+# Shared, already-validated sub-models; tests must not mutate them
+_RETRY = RetryConfig(max_attempts=3, backoff_ms=1000, backoff_multiplier=2.0, jitter=True)
+_PERM = Permission(
+    action="read",
+    resource="test_resource",
+    intent=Intent.READ,
+    data_zone=DataZone.INTERNAL,
+)
+_SANDBOX = SandboxConfig(enabled=True, type=SandboxType.CONTAINER, simulation_mode=False)
+
+
+def _field(model, path):
+    """Resolve a dotted attribute path such as "tasks.0.retry.max_attempts"."""
+    for part in path.split("."):
+        model = model[int(part)] if part.isdigit() else getattr(model, part)
+    return model
+
+
+@pytest.fixture(scope="module")
+def base_workflow():
+    """Create a minimal workflow spec, validated once for the module."""
+    return _WORKFLOW_ADAPTER.validate_python(_BASE_WORKFLOW_DATA)
+
+
+@pytest.mark.parametrize(
+    "extra_kwargs,expected",
+    [
+        pytest.param(
+            {},
+            {"id": "test-workflow", "name": "Test Workflow", "tasks.0.id": "task1", "goal": None},
+            id="minimal",
+        ),
+        pytest.param(
+            {
+                "goal": "Process data safely",
+                "constraints": ["Must validate inputs", "Must log operations"],
+                "success_criteria": ["All tasks succeed", "No errors"],
+                "tasks": [
+                    TaskSpec(
+                        **_BASE_TASK_DATA,
+                        tool_name="test_tool",
+                        risk_tier=RiskTier.LOW,
+                        intent=Intent.READ,
+                        retry=_RETRY,
+                        timeout_ms=5000,
+                        required_permissions=[_PERM],
+                        sandbox_config=_SANDBOX,
+                    )
+                ],
+                "safety_policy": SafetyPolicy(
+                    name="Test Policy",
+                    description="Test safety policy",
+                    rules=[
+                        SafetyRule(type="validation", description="Validate inputs")
+                    ],
+                    fail_fast=True,
+                ),
+            },
+            {
+                "goal": "Process data safely",
+                "constraints.1": "Must log operations",
+                "success_criteria.1": "No errors",
+                "tasks.0.risk_tier": "LOW",
+                "tasks.0.retry": _RETRY,
+                "tasks.0.required_permissions.0": _PERM,
+                "safety_policy.name": "Test Policy",
+            },
+            id="full",
+        ),
+    ],
+)
+def test_workflow_spec_fields(extra_kwargs, expected):
+    """Test creating minimal and full workflow specs from the shared base."""
+    workflow = _WORKFLOW_ADAPTER.validate_python({**_BASE_WORKFLOW_DATA, **extra_kwargs})
+    
+    assert len(workflow.tasks) == 1
+    for path, value in expected.items():
+        assert _field(workflow, path) == value, path
+
 
-def test_workflow_spec_minimal():
-    """Test creating a minimal workflow spec."""
+def test_workflow_spec_dependency_index():
+    """Test dependencies are indexed by task position."""
     workflow = WorkflowSpec(
         id="test-workflow",
         name="Test Workflow",
         tasks=[
-            TaskSpec(
-                id="task1",
-                name="First Task",
-                type=TaskType.ACTION,
-            )
+            TaskSpec(id="read", name="Read", type=TaskType.ACTION),
+            TaskSpec(id="transform", name="Transform", type=TaskType.ACTION),
+            TaskSpec(id="write", name="Write", type=TaskType.ACTION),
         ],
-        dependencies={"task1": []},
+        dependencies={
+            "read": [],
+            "transform": ["read"],
+            "write": ["transform", "read", "missing"],
+        },
     )
     
-    assert workflow.id == "test-workflow"
-    assert workflow.name == "Test Workflow"
-    assert len(workflow.tasks) == 1
-    assert workflow.tasks[0].id == "task1"
+    assert workflow.task_position("write") == 2
+    assert list(workflow.iter_dependencies()) == [(1, 0), (2, 1), (2, 0)]
 
 
-def test_workflow_spec_full():
-    """Test creating a full workflow spec with all fields."""
+def test_workflow_spec_dependency_index_tracks_changes():
+    """Test the dependency index is rebuilt after in-place edits and model_copy."""
     workflow = WorkflowSpec(
         id="test-workflow",
         name="Test Workflow",
-        goal="Process data safely",
-        constraints=["Must validate inputs", "Must log operations"],
-        success_criteria=["All tasks succeed", "No errors"],
-        tasks=[
-            TaskSpec(
-                id="task1",
-                name="First Task",
-                type=TaskType.ACTION,
-                tool_name="test_tool",
-                risk_tier=RiskTier.LOW,
-                intent=Intent.READ,
-                retry=RetryConfig(
-                    max_attempts=3,
-                    backoff_ms=1000,
-                    backoff_multiplier=2.0,
-                    jitter=True,
-                ),
-                timeout_ms=5000,
-                required_permissions=[
-                    Permission(
-                        action="read",
-                        resource="test_resource",
-                        intent=Intent.READ,
-                        data_zone=DataZone.INTERNAL,
-                    )
-                ],
-                sandbox_config=SandboxConfig(
-                    enabled=True,
-                    type=SandboxType.CONTAINER,
-                    simulation_mode=False,
-                ),
-            )
-        ],
-        dependencies={"task1": []},
-        safety_policy=SafetyPolicy(
-            name="Test Policy",
-            description="Test safety policy",
-            rules=[
-                SafetyRule(type="validation", description="Validate inputs")
-            ],
-            fail_fast=True,
-        ),
+        tasks=[TaskSpec(id="a", name="A", type=TaskType.ACTION)],
+        dependencies={"a": []},
     )
+    assert list(workflow.iter_dependencies()) == []
+    
+    workflow.tasks.append(TaskSpec(id="b", name="B", type=TaskType.ACTION))
+    workflow.dependencies["b"] = ["a"]
     
-    assert workflow.goal == "Process data safely"
-    assert len(workflow.constraints) == 2
-    assert len(workflow.success_criteria) == 2
-    assert workflow.tasks[0].risk_tier == RiskTier.LOW
-    assert workflow.tasks[0].retry.max_attempts == 3
-    assert workflow.safety_policy.name == "Test Policy"
+    assert workflow.task_position("b") == 1
+    assert list(workflow.iter_dependencies()) == [(1, 0)]
+    
+    copied = workflow.model_copy(update={"dependencies": {"a": ["b"]}})
+    
+    assert list(copied.iter_dependencies()) == [(0, 1)]
+    assert list(workflow.iter_dependencies()) == [(1, 0)]
 
 
 def test_task_spec_validation():
@@ -110,15 +176,65 @@ def test_task_spec_validation():
         type=TaskType.ACTION,
     )
     assert task.id == "task1"
+
+
+_VALID_RETRY_DATA = {"max_attempts": 3, "backoff_ms": 1000}
+
+
+@pytest.mark.parametrize(
+    "model,data,field,invalid_value",
+    [
+        (TaskSpec, _BASE_TASK_DATA, "timeout_ms", -1),
+        (TaskSpec, _BASE_TASK_DATA, "timeout_ms", 0),
+        (TaskSpec, _BASE_TASK_DATA, "type", "unknown"),
+        (RetryConfig, _VALID_RETRY_DATA, "max_attempts", 0),
+        (RetryConfig, _VALID_RETRY_DATA, "backoff_ms", 0),
+        (RetryConfig, _VALID_RETRY_DATA, "backoff_multiplier", -1.0),
+    ],
+)
+def test_invalid_field_values(model, data, field, invalid_value):
+    """Test out-of-range and unknown values are rejected."""
+    error = _expect_validation_error(model, **{**data, field: invalid_value})
+    
+    assert error.errors()[0]["loc"] == (field,)
+
+
+def test_task_spec_interns_identifiers():
+    """Test task ids and tool names decoded separately share one string object."""
+    payload = '{"id": "task1", "name": "Test Task", "type": "action", "tool_name": "http"}'
+    first = TaskSpec.model_validate_json(payload)
+    second = TaskSpec.model_validate_json(payload)
+    
+    assert first.id is second.id
+    assert first.tool_name is second.tool_name
+
+
+def test_task_spec_intern():
+    """Test interned tasks are reused for identical arguments."""
+    task = TaskSpec.intern(id="task1", name="Test Task", type=TaskType.ACTION, tool_name="tool")
+    
+    same = TaskSpec.intern(tool_name="tool", type=TaskType.ACTION, name="Test Task", id="task1")
+    assert task is same
+    assert task is not TaskSpec.intern(id="task2", name="Test Task", type=TaskType.ACTION)
+    assert task == TaskSpec(id="task1", name="Test Task", type=TaskType.ACTION, tool_name="tool")
+    
+    # Container arguments fall back to regular validation and are never shared
+    with_inputs = TaskSpec.intern(id="task1", name="Test Task", type=TaskType.ACTION, inputs={})
+    assert with_inputs.inputs == {}
+    
+    permissions = (Permission(action="read", resource="db"),)
+    first = TaskSpec.intern(
+        id="task1", name="Test Task", type=TaskType.ACTION, required_permissions=permissions
+    )
+    second = TaskSpec.intern(
+        id="task1", name="Test Task", type=TaskType.ACTION, required_permissions=permissions
+    )
+    assert first is not second
+    first.required_permissions.append(Permission(action="write", resource="db"))
+    assert len(second.required_permissions) == 1
     
-    # Invalid timeout (negative)
     with pytest.raises(ValidationError):
-        TaskSpec(
-            id="task1",
-            name="Test Task",
-            type=TaskType.ACTION,
-            timeout_ms=-1,
-        )
+        TaskSpec.intern(id="task1", name="Test Task", type=TaskType.ACTION, timeout_ms=0)
 
 
 def test_retry_config():
@@ -172,56 +288,68 @@ def test_sandbox_config():
     assert config.permissions["network"] == "allowed"
 
 
-def test_workflow_spec_serialization():
-    """Test workflow spec serialization to JSON."""
-    workflow = WorkflowSpec(
-        id="test-workflow",
-        name="Test Workflow",
-        tasks=[
-            TaskSpec(
-                id="task1",
-                name="First Task",
-                type=TaskType.ACTION,
-            )
+def test_safety_policy_rules_of_type():
+    """Test safety rules are looked up by type."""
+    policy = SafetyPolicy(
+        name="Test Policy",
+        rules=[
+            SafetyRule(type="validation", description="Validate inputs"),
+            SafetyRule(type="rate_limit", description="Limit calls"),
+            SafetyRule(type="validation", description="Validate outputs"),
         ],
-        dependencies={"task1": []},
     )
     
-    # Serialize to dict
-    workflow_dict = workflow.model_dump()
-    assert workflow_dict["id"] == "test-workflow"
-    assert workflow_dict["name"] == "Test Workflow"
+    assert [r.description for r in policy.rules_of_type("validation")] == [
+        "Validate inputs",
+        "Validate outputs",
+    ]
+    assert policy.rules_of_type("unknown") == []
+    
+    # Edits after validation are picked up
+    policy.rules.append(SafetyRule(type="rate_limit", description="Limit tokens"))
+    assert len(policy.rules_of_type("rate_limit")) == 2
+    
+    policy.rules[0].type = "audit"
+    assert [r.description for r in policy.rules_of_type("validation")] == ["Validate outputs"]
+    assert [r.description for r in policy.rules_of_type("audit")] == ["Validate inputs"]
+    
+    policy.rules = [SafetyRule(type="audit")]
+    assert policy.rules_of_type("validation") == []
+    assert [r.type for r in policy.rules_of_type("audit")] == ["audit"]
+
+
+def test_workflow_spec_serialization(base_workflow):
+    """Test workflow spec serialization to JSON."""
+    workflow = base_workflow
     
-    # Serialize to JSON
+    # Serialize once to JSON and check the decoded dict
     workflow_json = workflow.model_dump_json()
-    assert "test-workflow" in workflow_json
+    workflow_dict = json.loads(workflow_json)
+    assert workflow_dict["id"] == "test-workflow"
+    assert workflow_dict["name"] == "Test Workflow"
+    assert workflow.model_dump_json(include={"id"}) == '{"id":"test-workflow"}'
 
 
 def test_workflow_spec_deserialization():
     """Test workflow spec deserialization from JSON."""
-    workflow_data = {
-        "id": "test-workflow",
-        "name": "Test Workflow",
-        "tasks": [
-            {
-                "id": "task1",
-                "name": "First Task",
-                "type": "action",
-            }
-        ],
-        "dependencies": {"task1": []},
-    }
-    
-    workflow = WorkflowSpec.model_validate(workflow_data)
+    workflow = _WORKFLOW_ADAPTER.validate_json(_BASE_WORKFLOW_JSON)
     assert workflow.id == "test-workflow"
     assert workflow.name == "Test Workflow"
     assert len(workflow.tasks) == 1
 
 
-def test_enum_values():
+@pytest.mark.parametrize(
+    "enum_member,expected",
+    [
+        (RiskTier.LOW, "LOW"),
+        (Intent.READ, "read"),
+        (DataZone.INTERNAL, "internal"),
+        (SandboxType.CONTAINER, "container"),
+        (TaskType.ACTION, "action"),
+    ],
+)
+def test_enum_values(enum_member, expected):
     """Test enum values."""
-    assert RiskTier.LOW.value == "LOW"
-    assert Intent.READ.value == "read"
-    assert DataZone.INTERNAL.value == "internal"
-    assert SandboxType.CONTAINER.value == "container"
-    assert TaskType.ACTION.value == "action"
+    assert enum_member.value == expected
+    # str-backed enums compare equal to their wire value
+    assert enum_member == expected